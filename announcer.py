@@ -10,20 +10,17 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import functools
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 
 from loguru import logger
 
 from config import DEFAULT_TEMPLATES
 
-# provider_id 后缀到 activity key 的映射
-_PROVIDER_SUFFIX_MAP = {
-    ".class": "class",
-    ".activity": "activity",
-    ".break": "break",
-    ".free": "free",
-    ".preparation": "preparation",
-}
+# provider_id 最后一段即为 activity key；新增 activity 类型只需在
+# DEFAULT_TEMPLATES 中补充模板，匹配始终是一次哈希查找
+_ACTIVITY_KEYS = frozenset(DEFAULT_TEMPLATES)
 
 
 def _resolve_activity_key(provider_id: str) -> Optional[str]:
@@ -33,16 +30,131 @@ def _resolve_activity_key(provider_id: str) -> Optional[str]:
     """
     if not provider_id:
         return None
-    for suffix, key in _PROVIDER_SUFFIX_MAP.items():
-        if provider_id.endswith(suffix):
-            return key
-    return None
+    _, sep, tail = provider_id.rpartition(".")
+    return tail if sep and tail in _ACTIVITY_KEYS else None
+
+
+# 模板渲染后需从首尾去除的标点与空白
+_STRIP_CHARS = "。，, .\t\n\r\v\f\u3000"
+
+# 模板中允许出现的变量名
+_TEMPLATE_FIELDS = frozenset({
+    "title", "message",
+    "subject", "teacher", "location",
+    "next_subject", "next_teacher", "next_location",
+})
+
+# 渲染函数：接收模板变量，返回清理后的文案
+Renderer = Callable[[Mapping[str, str]], str]
+
+# 渲染函数缓存容量：设置页每次编辑模板都会编译一次，只需保留最近用过的
+_RENDERER_CACHE_SIZE = 32
+
+
+def _compile_template(template: str) -> Optional[Tuple[List[str], List[str]]]:
+    """将模板预扫描为 (literals, fields)，其中 len(literals) == len(fields) + 1。
+
+    仅处理 ``{name}`` 形式的简单变量与 ``{{`` / ``}}`` 转义；
+    含格式说明、属性/下标访问或未知变量时返回 None，由调用方回退到 str.format。
+    """
+    literals: List[str] = []
+    fields: List[str] = []
+    chunk: List[str] = []
+    i = 0
+    while True:
+        lbrace = template.find("{", i)
+        rbrace = template.find("}", i)
+        if lbrace < 0 and rbrace < 0:
+            chunk.append(template[i:])
+            break
+        if rbrace >= 0 and (lbrace < 0 or rbrace < lbrace):
+            # 单独出现的 "}" 只能是 "}}" 转义
+            if not template.startswith("}}", rbrace):
+                return None
+            chunk.append(template[i:rbrace + 1])
+            i = rbrace + 2
+            continue
+        if template.startswith("{{", lbrace):
+            chunk.append(template[i:lbrace + 1])
+            i = lbrace + 2
+            continue
+        end = template.find("}", lbrace + 1)
+        if end < 0:
+            return None
+        name = template[lbrace + 1:end]
+        if name not in _TEMPLATE_FIELDS:
+            return None
+        chunk.append(template[i:lbrace])
+        literals.append("".join(chunk))
+        chunk = []
+        fields.append(name)
+        i = end + 1
+    literals.append("".join(chunk))
+    return literals, fields
+
+
+def _make_renderer(template: str) -> Renderer:
+    """根据模板的预扫描结果生成对应的渲染函数。"""
+    compiled = _compile_template(template)
+    if compiled is None:
+        def render(fields: Mapping[str, str]) -> str:
+            if not isinstance(fields, defaultdict):
+                fields = defaultdict(str, fields)
+            return template.format_map(fields).strip(_STRIP_CHARS)
+        return render
+
+    literals, names = compiled
+    if not names:
+        # 纯文本模板（如 "放学了"）：结果恒定，提前完成标点清理
+        text = literals[0].strip(_STRIP_CHARS)
+        return lambda fields: text
+    if len(names) == 1:
+        prefix, suffix = literals
+        name = names[0]
+        return lambda fields: (prefix + fields.get(name, "") + suffix).strip(_STRIP_CHARS)
+
+    def render(fields: Mapping[str, str]) -> str:
+        parts = []
+        for lit, field in zip(literals, names):
+            parts.append(lit)
+            parts.append(fields.get(field, ""))
+        parts.append(literals[-1])
+        return "".join(parts).strip(_STRIP_CHARS)
+    return render
+
+
+@functools.lru_cache(maxsize=_RENDERER_CACHE_SIZE)
+def compile_template(template: str) -> Renderer:
+    """返回模板的渲染函数，首次使用时编译并按模板字符串缓存（LRU，容量有限）。
+
+    渲染函数接收模板变量（缺失的变量渲染为空字符串），返回清理首尾标点后的文案；
+    模板格式非法时抛出 ValueError（也可能抛出 IndexError / AttributeError）。
+    """
+    return _make_renderer(template)
+
+
+def render_template(template: str, fields: Mapping[str, str]) -> str:
+    """渲染模板并清理首尾多余的标点与空白。
+
+    :param template: 模板字符串
+    :param fields: 模板变量，缺失的变量渲染为空字符串
+    :raises ValueError: 模板格式非法（也可能抛出 IndexError / AttributeError）
+    """
+    return compile_template(template)(fields)
+
+
+# 默认模板在导入时即完成编译：它们都是纯文本或单变量模板，
+# 渲染只是字符串拼接，完全绕开 str.format
+for _template in DEFAULT_TEMPLATES.values():
+    compile_template(_template)
+del _template
 
 
 def build_announce_text(
     payload: dict,
-    templates: Optional[Dict[str, str]] = None,
+    templates: Optional[Mapping[str, str]] = None,
     runtime_context: Optional[dict] = None,
+    compiled: Optional[Mapping[str, Renderer]] = None,
 ) -> Optional[str]:
     """根据通知 payload 和模板构建朗读文案。
 
@@ -55,16 +167,17 @@ def build_announce_text(
         - next_subject: 下一节科目名称
         - next_teacher: 下一节教师
         - next_location: 下一节地点
+    :param compiled: 预编译的渲染函数 {activity_key: renderer}，命中时跳过模板查找
     :return: 朗读文本，无需朗读时返回 None
     """
-    logger.debug("[TTS.Announcer] 收到 payload: keys={}", list(payload.keys()))
-
     provider_id = (payload.get("provider_id") or "").strip()
     title = (payload.get("title") or "").strip()
     message = (payload.get("message") or "").strip()
 
-    logger.debug("[TTS.Announcer] provider_id={!r}, title={!r}, message={!r}",
-                 provider_id, title, message)
+    # 解析 activity 类型；日程类通知即使标题正文为空也可由模板生成文案
+    activity_key = _resolve_activity_key(provider_id)
+    if activity_key is None and not title and not message:
+        return None
 
     # 从 runtime_context 提取结构化课程信息
     ctx = runtime_context or {}
@@ -75,36 +188,44 @@ def build_announce_text(
     next_teacher = ctx.get("next_teacher", "")
     next_location = ctx.get("next_location", "")
 
-    logger.debug("[TTS.Announcer] runtime_context: subject={!r}, teacher={!r}, "
-                 "location={!r}, next_subject={!r}",
-                 subject, teacher, location, next_subject)
-
-    # 解析 activity 类型
-    activity_key = _resolve_activity_key(provider_id)
-    logger.debug("[TTS.Announcer] activity_key={!r}", activity_key)
+    logger.opt(lazy=True).debug("[TTS.Announcer] 收到 payload: {}", lambda: {
+        "keys": list(payload.keys()),
+        "provider_id": provider_id,
+        "title": title,
+        "message": message,
+        "subject": subject,
+        "teacher": teacher,
+        "location": location,
+        "next_subject": next_subject,
+        "activity_key": activity_key,
+    })
 
     if activity_key:
-        # 使用模板
-        tmpl_dict = templates if templates else DEFAULT_TEMPLATES
-        template = tmpl_dict.get(activity_key, "")
-        if not template:
-            template = DEFAULT_TEMPLATES.get(activity_key, "{title}。{message}")
+        # 使用模板；传入 effective_templates 时一次 get 即可命中，空模板回退到默认
+        renderer = compiled.get(activity_key) if compiled else None
+        if renderer is None:
+            template = (
+                (templates or DEFAULT_TEMPLATES).get(activity_key)
+                or DEFAULT_TEMPLATES.get(activity_key, "{title}。{message}")
+            )
+            renderer = compile_template(template)
+
+        # 未知变量渲染为空字符串，无需处理 KeyError
+        ctx_map: Dict[str, str] = defaultdict(str, {
+            "title": title,
+            "message": message,
+            "subject": subject,
+            "teacher": teacher,
+            "location": location,
+            "next_subject": next_subject,
+            "next_teacher": next_teacher,
+            "next_location": next_location,
+        })
 
         try:
-            result = template.format(
-                title=title,
-                message=message,
-                subject=subject,
-                teacher=teacher,
-                location=location,
-                next_subject=next_subject,
-                next_teacher=next_teacher,
-                next_location=next_location,
-            )
-            # 清理多余的标点
-            result = result.strip("。，, .")
-            result = result.strip()
-        except (KeyError, IndexError) as e:
+            result = renderer(ctx_map)
+        except (ValueError, IndexError, AttributeError, TypeError, KeyError) as e:
+            # 格式说明非法、位置参数、下标/属性访问失败或预编译渲染器缺少字段
             logger.warning("[TTS.Announcer] 模板格式化失败: {}, 回退", e)
             result = f"{title}。{message}" if message else title
 
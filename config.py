@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from collections import ChainMap
+from typing import Dict, Mapping
 
 from loguru import logger
 from ClassWidgets.SDK import ConfigBaseModel
@@ -33,7 +34,7 @@ class TTSPluginConfig(ConfigBaseModel):
     :param engine: TTS 引擎名称，可选值: auto / edge / winrt / pyttsx3
     :param voice: 语音名称，空字符串表示使用引擎默认语音
     :param volume: 播放音量 0.0 ~ 1.0
-    :param templates: 各 activity 类型的朗读文案模板
+    :param templates: 用户自定义的 activity 朗读文案模板，未覆盖的 key 使用默认模板
     """
 
     engine: str = "auto"
@@ -43,9 +44,10 @@ class TTSPluginConfig(ConfigBaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
-        # 确保所有默认模板都存在
-        for key, default_text in DEFAULT_TEMPLATES.items():
-            if key not in self.templates:
-                self.templates[key] = default_text
         logger.debug("[TTS.Config] TTSPluginConfig 创建, engine={}, voice={}, volume={}",
                      self.engine, self.voice, self.volume)
+
+    @property
+    def effective_templates(self) -> Mapping[str, str]:
+        """用户模板叠加在默认模板之上的只读视图（不复制默认模板）。"""
+        return ChainMap(self.templates, DEFAULT_TEMPLATES)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Dict, List, Optional, Tuple, Type
 
 from loguru import logger
@@ -26,8 +27,10 @@ def create_engine(preference: str = "auto", voice: str = "") -> Optional[TTSEngi
     :param voice: 语音标识符，空字符串使用默认
     :return: TTSEngine 实例，全部不可用时返回 None
     """
-    logger.debug("[TTS.Engine] create_engine 调用, preference={}, voice={}", preference, voice)
-    logger.debug("[TTS.Engine] 已注册引擎: {}", [cls.name for cls in ENGINE_REGISTRY])
+    logger.opt(lazy=True).debug(
+        "[TTS.Engine] create_engine 调用, preference={}, voice={}, 已注册引擎: {}",
+        lambda: preference, lambda: voice, lambda: [cls.name for cls in ENGINE_REGISTRY],
+    )
 
     if preference != "auto":
         for cls in ENGINE_REGISTRY:
@@ -66,9 +69,12 @@ def create_engine(preference: str = "auto", voice: str = "") -> Optional[TTSEngi
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def list_available_engines() -> List[Dict[str, str]]:
     """列出所有可用的引擎。
 
+    结果在进程内只探测一次并缓存，调用方不应修改返回的列表。
+
     :return: [{"name": engine_name, "available": "true"/"false"}, ...]
     """
     result = []
@@ -82,14 +88,17 @@ def list_available_engines() -> List[Dict[str, str]]:
     return result
 
 
-def list_voices_for_engine(engine_name: str) -> List[Tuple[str, str]]:
+def list_voices_for_engine(engine_name: str, refresh: bool = False) -> List[Tuple[str, str]]:
     """列出指定引擎的所有可用语音。
 
+    :param refresh: 为 True 时先清除引擎的语音缓存，重新枚举
     :return: [(voice_id, display_name), ...]
     """
     for cls in ENGINE_REGISTRY:
         if cls.name == engine_name:
             try:
+                if refresh:
+                    cls.refresh_voices()
                 return cls.list_voices()
             except Exception as e:
                 logger.warning("[TTS.Engine] 列出 {} 语音失败: {}", engine_name, e)
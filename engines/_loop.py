@@ -0,0 +1,42 @@
+"""引擎共享的后台 asyncio 事件循环。
+
+EdgeTTS / WinRT 的异步合成都提交到同一个常驻循环执行，
+避免每次 asyncio.run() 创建并销毁事件循环。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """返回后台事件循环，首次调用时在守护线程中启动。"""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="cw2-tts-asyncio",
+                daemon=True,
+            ).start()
+            _loop = loop
+            logger.debug("[TTS.Engine] 后台事件循环已启动")
+        return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """在后台事件循环中执行协程并阻塞等待结果。
+
+    不可在后台循环线程内部调用，否则会死锁。
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -15,11 +17,23 @@ class TTSEngine(ABC):
     """
 
     name: str = "base"
+    # 合成产物的文件扩展名
+    audio_suffix: str = ".wav"
+
+    # is_available 的探测结果，按子类分别缓存
+    _availability: Optional[bool] = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """检测当前环境是否支持此后端，首次探测后缓存结果。"""
+        if cls._availability is None:
+            cls._availability = cls._probe()
+        return cls._availability
 
     @staticmethod
     @abstractmethod
-    def is_available() -> bool:
-        """检测当前环境是否支持此后端。"""
+    def _probe() -> bool:
+        """实际的可用性探测逻辑，由各后端实现。"""
         ...
 
     @abstractmethod
@@ -31,6 +45,23 @@ class TTSEngine(ABC):
         """
         ...
 
+    def synthesize_bytes(self, text: str) -> bytes:
+        """将文本合成为内存中的音频数据。
+
+        默认实现经由临时文件调用 synthesize，能直接输出到内存的后端应覆写此方法。
+
+        :param text: 待合成的文本
+        :return: 完整的音频文件内容（格式与 audio_suffix 一致）
+        """
+        fd, tmp = tempfile.mkstemp(prefix=f"cw2_tts_{self.name}_", suffix=self.audio_suffix)
+        os.close(fd)
+        tmp_path = Path(tmp)
+        try:
+            self.synthesize(text, tmp_path)
+            return tmp_path.read_bytes()
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     @staticmethod
     def list_voices() -> List[Tuple[str, str]]:
         """列出此引擎可用的语音列表。
@@ -39,6 +70,10 @@ class TTSEngine(ABC):
         """
         return []
 
+    @classmethod
+    def refresh_voices(cls) -> None:
+        """清除 list_voices 的缓存结果，下次调用时重新枚举。"""
+
     def set_voice(self, voice_id: str) -> None:
         """切换当前使用的语音。
 
@@ -49,6 +84,14 @@ class TTSEngine(ABC):
         """获取当前使用的语音标识符。"""
         return ""
 
+    def prepare(self, reconnect: bool = False) -> None:
+        """预热后端的长期会话（事件循环、合成器实例等）。
+
+        Speaker 创建时调用一次；合成失败后以 reconnect=True 再次调用以重建会话。
+
+        :param reconnect: 为 True 时丢弃现有会话并重新建立
+        """
+
     def stop(self) -> None:
         """中断当前合成（如有需要可覆写）。"""
 
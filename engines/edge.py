@@ -2,57 +2,71 @@
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from loguru import logger
 
+from engines._loop import get_loop, run_coroutine
 from engines.base import TTSEngine
 
+_IMPORT_ERROR: Optional[ImportError] = None
+try:
+    import edge_tts
+except ImportError as e:
+    edge_tts = None
+    _IMPORT_ERROR = e
+
+# list_voices 结果缓存（需联网获取），通过 refresh_voices 失效
+_VOICES_CACHE: Optional[List[Tuple[str, str, str]]] = None
+
 
 class EdgeTTSEngine(TTSEngine):
     """使用 edge_tts 将文本合成为 mp3 文件。"""
 
     name = "edge"
+    audio_suffix = ".mp3"
     DEFAULT_VOICE = "zh-CN-XiaoxiaoNeural"
 
     def __init__(self, voice: str = "zh-CN-XiaoxiaoNeural") -> None:
         self._voice = voice or self.DEFAULT_VOICE
         logger.debug("[TTS.EdgeTTS] 初始化, voice={}", voice)
-        import edge_tts
-
-        self._edge_tts = edge_tts
-        logger.debug("[TTS.EdgeTTS] edge_tts 模块导入成功")
 
     @staticmethod
-    def is_available() -> bool:
-        try:
-            import edge_tts  # noqa: F401
-
-            logger.debug("[TTS.EdgeTTS] is_available=True")
-            return True
-        except ImportError as e:
-            logger.debug("[TTS.EdgeTTS] is_available=False, ImportError: {}", e)
+    def _probe() -> bool:
+        if edge_tts is None:
+            logger.debug("[TTS.EdgeTTS] is_available=False, ImportError: {}", _IMPORT_ERROR)
             return False
+        logger.debug("[TTS.EdgeTTS] is_available=True")
+        return True
 
     @staticmethod
     def list_voices() -> List[Tuple[str, str]]:
         """列出 EdgeTTS 所有可用语音。"""
+        global _VOICES_CACHE
+        if _VOICES_CACHE is not None:
+            return _VOICES_CACHE
         try:
-            import edge_tts
-            voices = asyncio.run(edge_tts.list_voices())
+            voices = run_coroutine(edge_tts.list_voices())
             result = []
             for v in voices:
                 vid = v["ShortName"]
                 locale = v.get("Locale", "")
                 display = f"{v['ShortName']} ({locale})"
                 result.append((vid, display, locale))
+            # 只缓存成功且非空的枚举结果，失败或为空时下次重新获取
+            if result:
+                _VOICES_CACHE = result
             return result
         except Exception as e:
             logger.warning("[TTS.EdgeTTS] list_voices 失败: {}", e)
             return [("zh-CN-XiaoxiaoNeural", "zh-CN-XiaoxiaoNeural (zh-CN)")]
 
+    @classmethod
+    def refresh_voices(cls) -> None:
+        global _VOICES_CACHE
+        _VOICES_CACHE = None
+
     def set_voice(self, voice_id: str) -> None:
         self._voice = voice_id or self.DEFAULT_VOICE
         logger.debug("[TTS.EdgeTTS] 语音切换为: {}", self._voice)
@@ -60,13 +74,23 @@ class EdgeTTSEngine(TTSEngine):
     def get_current_voice(self) -> str:
         return self._voice
 
+    def prepare(self, reconnect: bool = False) -> None:
+        # 每次 Communicate 都会新建 websocket 连接，可预热的只有后台事件循环
+        get_loop()
+
     def synthesize(self, text: str, out_path: Path) -> None:
         logger.debug("[TTS.EdgeTTS] 开始合成, 文本长度={}, 输出={}", len(text), out_path)
-        asyncio.run(self._synthesize_async(text, out_path))
+        out_path.write_bytes(self.synthesize_bytes(text))
+
+    def synthesize_bytes(self, text: str) -> bytes:
+        return run_coroutine(self._synthesize_async(text))
 
-    async def _synthesize_async(self, text: str, out_path: Path) -> None:
+    async def _synthesize_async(self, text: str) -> bytes:
         voice = self._voice or self.DEFAULT_VOICE
-        communicate = self._edge_tts.Communicate(text=text, voice=voice)
-        await communicate.save(str(out_path))
-        logger.debug("[TTS.EdgeTTS] 合成完成: {} ({} bytes)", out_path,
-                      out_path.stat().st_size if out_path.exists() else 0)
+        communicate = edge_tts.Communicate(text=text, voice=voice)
+        buf = bytearray()
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                buf.extend(chunk["data"])
+        logger.debug("[TTS.EdgeTTS] 合成完成: {} bytes", len(buf))
+        return bytes(buf)
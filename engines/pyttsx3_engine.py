@@ -5,14 +5,45 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from loguru import logger
 
 from engines.base import TTSEngine
 
+_IMPORT_ERROR: Optional[Exception] = None
+if sys.platform == "win32":
+    try:
+        import pyttsx3
+    except (ImportError, RuntimeError) as e:
+        pyttsx3 = None
+        _IMPORT_ERROR = e
+else:
+    pyttsx3 = None
+
+# list_voices 结果缓存（避免重复 pyttsx3.init()），通过 refresh_voices 失效
+_VOICES_CACHE: Optional[List[Tuple[str, str, str]]] = None
+
+
+# pyttsx3.init() 按驱动返回进程内共享的同一 Engine：记录当前由哪个实例驱动其外部循环，
+# 旧实例延迟 cleanup 时不会结束新实例正在使用的循环
+_LOOP_OWNERS: "weakref.WeakKeyDictionary[object, Pyttsx3Engine]" = weakref.WeakKeyDictionary()
+_LOOP_LOCK = threading.Lock()
+
+
+def _file_size(path: Path) -> int:
+    """单次 stat 取文件大小，文件不存在时返回 -1。"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
 
 class Pyttsx3Engine(TTSEngine):
     """使用 pyttsx3 将文本合成为 wav/mp3 文件。"""
@@ -21,9 +52,19 @@ class Pyttsx3Engine(TTSEngine):
 
     def __init__(self, voice: str = "") -> None:
         logger.debug("[TTS.pyttsx3] 初始化, 调用 pyttsx3.init()...")
-        import pyttsx3
-
         self._engine = pyttsx3.init()
+        # 使用外部驱动循环：驱动只初始化一次，synthesize 中手动 iterate()
+        with _LOOP_LOCK:
+            if getattr(self._engine, "_inLoop", False):
+                # 共享的 Engine 循环仍在运行（旧实例尚未 cleanup），直接接管
+                logger.debug("[TTS.pyttsx3] 外部循环已在运行, 接管")
+            else:
+                self._engine.startLoop(False)
+            _LOOP_OWNERS[self._engine] = self
+        # 预绑定合成路径上频繁调用的驱动方法
+        self._save = self._engine.save_to_file
+        self._iterate = self._engine.iterate
+        self._is_busy = self._engine.isBusy
         self._voice_id = voice
         if voice:
             self._apply_voice(voice)
@@ -44,24 +85,23 @@ class Pyttsx3Engine(TTSEngine):
             logger.warning("[TTS.pyttsx3] 设置语音失败: {}", e)
 
     @staticmethod
-    def is_available() -> bool:
+    def _probe() -> bool:
         if sys.platform != "win32":
             logger.debug("[TTS.pyttsx3] is_available=False, 非 Windows 平台")
             return False
-        try:
-            import pyttsx3  # noqa: F401
-
-            logger.debug("[TTS.pyttsx3] is_available=True")
-            return True
-        except (ImportError, RuntimeError) as e:
-            logger.debug("[TTS.pyttsx3] is_available=False: {}", e)
+        if pyttsx3 is None:
+            logger.debug("[TTS.pyttsx3] is_available=False: {}", _IMPORT_ERROR)
             return False
+        logger.debug("[TTS.pyttsx3] is_available=True")
+        return True
 
     @staticmethod
     def list_voices() -> List[Tuple[str, str]]:
         """列出 pyttsx3 所有可用语音。"""
+        global _VOICES_CACHE
+        if _VOICES_CACHE is not None:
+            return _VOICES_CACHE
         try:
-            import pyttsx3
             engine = pyttsx3.init()
             voices = engine.getProperty("voices")
             result = []
@@ -72,11 +112,19 @@ class Pyttsx3Engine(TTSEngine):
                 display = f"{v.name} ({lang})" if lang else v.name
                 result.append((v.id, display, lang))
             engine.stop()
+            # 只缓存成功且非空的枚举结果，失败或为空时下次重新获取
+            if result:
+                _VOICES_CACHE = result
             return result
         except Exception as e:
             logger.warning("[TTS.pyttsx3] list_voices 失败: {}", e)
             return []
 
+    @classmethod
+    def refresh_voices(cls) -> None:
+        global _VOICES_CACHE
+        _VOICES_CACHE = None
+
     def set_voice(self, voice_id: str) -> None:
         self._apply_voice(voice_id)
 
@@ -85,10 +133,14 @@ class Pyttsx3Engine(TTSEngine):
 
     def synthesize(self, text: str, out_path: Path) -> None:
         logger.debug("[TTS.pyttsx3] 开始合成, 文本长度={}, 输出={}", len(text), out_path)
-        self._engine.save_to_file(text, str(out_path))
-        self._engine.runAndWait()
-        logger.debug("[TTS.pyttsx3] 合成完成: {} ({} bytes)", out_path,
-                      out_path.stat().st_size if out_path.exists() else 0)
+        self._save(text, str(out_path))
+        self._iterate()
+        while self._is_busy():
+            time.sleep(0.01)
+            self._iterate()
+        # 仅在 DEBUG 日志启用时才 stat 输出文件
+        logger.opt(lazy=True).debug("[TTS.pyttsx3] 合成完成: {} ({} bytes)",
+                                    lambda: out_path, lambda: _file_size(out_path))
 
     def stop(self) -> None:
         logger.debug("[TTS.pyttsx3] stop 调用")
@@ -99,9 +151,25 @@ class Pyttsx3Engine(TTSEngine):
 
     def cleanup(self) -> None:
         logger.debug("[TTS.pyttsx3] cleanup 开始")
-        try:
-            self._engine.stop()
-        except Exception:
-            pass
+        engine = self._engine
+        if engine is None:
+            return
+        with _LOOP_LOCK:
+            # 只有仍驱动该循环的实例才结束它；已被新实例接管时仅释放自身引用
+            owner = _LOOP_OWNERS.get(engine) is self
+            if owner:
+                del _LOOP_OWNERS[engine]
+                try:
+                    engine.endLoop()
+                except Exception:
+                    pass
+                try:
+                    engine.stop()
+                except Exception:
+                    pass
+        if not owner:
+            logger.debug("[TTS.pyttsx3] 循环已由新实例接管, 跳过 endLoop")
+        # 释放预绑定的方法，它们会让共享的 Engine 一直存活
+        self._save = self._iterate = self._is_busy = None  # type: ignore[assignment]
         self._engine = None  # type: ignore[assignment]
         logger.debug("[TTS.pyttsx3] cleanup 完成")
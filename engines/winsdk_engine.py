@@ -5,15 +5,30 @@
 
 from __future__ import annotations
 
-import asyncio
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from loguru import logger
 
+from engines._loop import get_loop, run_coroutine
 from engines.base import TTSEngine
 
+_IMPORT_ERROR: Optional[ImportError] = None
+if sys.platform == "win32":
+    try:
+        from winrt.windows.media.speechsynthesis import SpeechSynthesizer
+        from winrt.windows.storage.streams import DataReader
+        _WINRT = True
+    except ImportError as e:
+        _WINRT = False
+        _IMPORT_ERROR = e
+else:
+    _WINRT = False
+
+# list_voices 结果缓存，通过 refresh_voices 失效
+_VOICES_CACHE: Optional[List[Tuple[str, str, str]]] = None
+
 
 class WinRTEngine(TTSEngine):
     """使用 WinRT SpeechSynthesizer 将文本合成为 wav 文件。"""
@@ -21,9 +36,7 @@ class WinRTEngine(TTSEngine):
     name = "winrt"
 
     def __init__(self, voice: str = "") -> None:
-        logger.debug("[TTS.WinRT] 初始化, 导入 SpeechSynthesizer...")
-        from winrt.windows.media.speechsynthesis import SpeechSynthesizer
-
+        logger.debug("[TTS.WinRT] 初始化, 创建 SpeechSynthesizer...")
         self._synthesizer = SpeechSynthesizer()
         self._voice_id = voice
         if voice:
@@ -33,7 +46,6 @@ class WinRTEngine(TTSEngine):
     def _apply_voice(self, voice_id: str) -> None:
         """根据 voice_id 设置合成器语音。"""
         try:
-            from winrt.windows.media.speechsynthesis import SpeechSynthesizer
             all_voices = SpeechSynthesizer.all_voices
             for v in all_voices:
                 if v.id == voice_id or v.display_name == voice_id:
@@ -46,46 +58,68 @@ class WinRTEngine(TTSEngine):
             logger.warning("[TTS.WinRT] 设置语音失败: {}", e)
 
     @staticmethod
-    def is_available() -> bool:
+    def _probe() -> bool:
         if sys.platform != "win32":
             logger.debug("[TTS.WinRT] is_available=False, 非 Windows 平台")
             return False
-        try:
-            from winrt.windows.media.speechsynthesis import SpeechSynthesizer  # noqa: F401
-
-            logger.debug("[TTS.WinRT] is_available=True")
-            return True
-        except ImportError as e:
-            logger.debug("[TTS.WinRT] is_available=False, ImportError: {}", e)
+        if not _WINRT:
+            logger.debug("[TTS.WinRT] is_available=False, ImportError: {}", _IMPORT_ERROR)
             return False
+        logger.debug("[TTS.WinRT] is_available=True")
+        return True
 
     @staticmethod
     def list_voices() -> List[Tuple[str, str]]:
         """列出 WinRT 所有可用语音。"""
+        global _VOICES_CACHE
+        if _VOICES_CACHE is not None:
+            return _VOICES_CACHE
         try:
-            from winrt.windows.media.speechsynthesis import SpeechSynthesizer
             all_voices = SpeechSynthesizer.all_voices
             result = []
             for v in all_voices:
                 result.append((v.id, f"{v.display_name} ({v.language})", v.language))
+            # 只缓存成功且非空的枚举结果，失败或为空时下次重新获取
+            if result:
+                _VOICES_CACHE = result
             return result
         except Exception as e:
             logger.warning("[TTS.WinRT] list_voices 失败: {}", e)
             return []
 
+    @classmethod
+    def refresh_voices(cls) -> None:
+        global _VOICES_CACHE
+        _VOICES_CACHE = None
+
     def set_voice(self, voice_id: str) -> None:
         self._apply_voice(voice_id)
 
     def get_current_voice(self) -> str:
         return self._voice_id
 
+    def prepare(self, reconnect: bool = False) -> None:
+        get_loop()
+        if reconnect or self._synthesizer is None:
+            logger.debug("[TTS.WinRT] 重建 SpeechSynthesizer")
+            self._synthesizer = SpeechSynthesizer()
+            if self._voice_id:
+                self._apply_voice(self._voice_id)
+
     def synthesize(self, text: str, out_path: Path) -> None:
         logger.debug("[TTS.WinRT] 开始合成, 文本长度={}, 输出={}", len(text), out_path)
-        asyncio.run(self._synthesize_async(text, out_path))
-
-    async def _synthesize_async(self, text: str, out_path: Path) -> None:
-        from winrt.windows.storage.streams import DataReader
-
+        buf = run_coroutine(self._synthesize_async(text))
+        # IBuffer 支持缓冲区协议，直接写入，省去 bytes(buf) 的中间拷贝
+        with open(out_path, "wb") as f:
+            f.write(memoryview(buf))
+        logger.debug("[TTS.WinRT] 合成完成: {}", out_path)
+
+    def synthesize_bytes(self, text: str) -> bytes:
+        logger.debug("[TTS.WinRT] 开始合成到内存, 文本长度={}", len(text))
+        return bytes(run_coroutine(self._synthesize_async(text)))
+
+    async def _synthesize_async(self, text: str):
+        """合成音频并返回包含完整 wav 数据的 IBuffer。"""
         logger.debug("[TTS.WinRT] 调用 synthesize_text_to_stream_async...")
         stream = await self._synthesizer.synthesize_text_to_stream_async(text)
         logger.debug("[TTS.WinRT] 音频流大小: {} bytes", stream.size)
@@ -94,13 +128,9 @@ class WinRTEngine(TTSEngine):
         await reader.load_async(stream.size)
         buf = reader.read_buffer(stream.size)
 
-        out_path.write_bytes(bytes(buf))
-
         reader.close()
         stream.close()
-
-        logger.debug("[TTS.WinRT] 合成完成: {} ({} bytes)", out_path,
-                      out_path.stat().st_size if out_path.exists() else 0)
+        return buf
 
     def cleanup(self) -> None:
         logger.debug("[TTS.WinRT] cleanup, 释放 SpeechSynthesizer")
@@ -14,18 +14,75 @@ from __future__ import annotations
 
 import os
 import threading
-from typing import Optional
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import QTimer, Signal, Slot
 
 from ClassWidgets.SDK import CW2Plugin, PluginAPI
 
-from announcer import build_announce_text
+from announcer import Renderer, build_announce_text, compile_template
 from config import TTSPluginConfig, DEFAULT_TEMPLATES
 from engines import create_engine, list_available_engines, list_voices_for_engine
 from speaker import Speaker
 
+_PLUGIN_DIR = Path(__file__).resolve().parent
+_SETTINGS_QML = str(_PLUGIN_DIR / "qml" / "settings.qml")
+
+# 相同通知在此时间窗口（秒）内重复推送时只朗读一次
+_PUSH_DEBOUNCE = 2.0
+
+# 进程级缓存：引擎列表与各引擎的语音列表（QML 每次打开设置页都会查询）
+_engines_cache: Optional[List[dict]] = None
+# engine_name → (引擎返回的语音列表, 转换后的列表)；仅当引擎仍返回同一缓存列表时复用，
+# 引擎刷新缓存或返回失败回退列表（每次都是新对象）时自动重新转换
+_voices_cache: Dict[str, Tuple[list, List[dict]]] = {}
+_cache_lock = threading.Lock()
+
+# 环境变量覆盖可用引擎列表（逗号分隔），设置后跳过探测
+_ENGINES_ENV = "CW2_TTS_ENGINES"
+
+# 同一波通知推送内复用 runtime 课程信息的时间窗口（秒）
+_RUNTIME_CACHE_TTL = 0.5
+
+# 调试日志中单个值 repr 的最大长度
+_LOG_REPR_LIMIT = 200
+
+# 配置变更后延迟写盘的时间（毫秒），拖动滑块时合并为一次保存
+_SAVE_DELAY_MS = 400
+
+# 从宿主恢复的标量配置项: (字段名, 类型转换, 缺省值)
+_COERCERS = (
+    ("engine", str, "auto"),
+    ("voice", str, ""),
+    ("volume", float, 1.0),
+)
+
+
+def _brief(value) -> str:
+    """截断后的 repr，避免长 payload 拖慢日志格式化。"""
+    text = repr(value)
+    return text if len(text) <= _LOG_REPR_LIMIT else text[:_LOG_REPR_LIMIT] + "..."
+
+
+def _get_engine_list() -> List[dict]:
+    """返回引擎列表（含 "auto" 选项），首次调用时探测各引擎可用性。"""
+    global _engines_cache
+    with _cache_lock:
+        if _engines_cache is None:
+            override = os.environ.get(_ENGINES_ENV)
+            if override:
+                names = [n.strip() for n in override.split(",") if n.strip()]
+                logger.debug("[TTS] 使用 {} 指定的引擎列表: {}", _ENGINES_ENV, names)
+                engines = [{"name": n, "available": "true"} for n in names]
+            else:
+                engines = list_available_engines()
+            # 在列表前面加一个 "auto" 选项
+            _engines_cache = [{"name": "auto", "available": "true"}] + engines
+        return _engines_cache
+
 
 class Plugin(CW2Plugin):
     # 通知 QML 刷新的信号
@@ -37,9 +94,25 @@ class Plugin(CW2Plugin):
         logger.debug("[TTS] Plugin.__init__ 开始")
         super().__init__(api)
         self._config = TTSPluginConfig()
+        # activity_key → 预编译的渲染函数，模板变更时重建
+        self._compiled_templates: Dict[str, Renderer] = {}
+        self._rebuild_compiled_templates()
         self._speaker: Optional[Speaker] = None
+        # 已发布给 QML 的语音列表（设置页打开时读取，之后随 voiceListChanged 更新）
         self._voice_cache: list = []
         self._voices_loading = False
+        self._last_push: Optional[tuple] = None
+        self._last_push_ts = 0.0
+        # schedule.subjects 的 {id: subject} 索引，schedule 对象变化时重建
+        self._subjects_index: Optional[dict] = None
+        self._subjects_index_src = None
+        # (获取时间, runtime_context)，课表变化时失效
+        self._rt_cache: Optional[Tuple[float, dict]] = None
+        # 防抖保存配置：每次变更重新计时，静止后统一写盘
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_config)
         logger.debug("[TTS] Plugin.__init__ 完成, 默认引擎配置: {}", self._config.engine)
 
     # ---- 生命周期 ----------------------------------------------------------
@@ -51,6 +124,7 @@ class Plugin(CW2Plugin):
         # 加载已有配置
         logger.debug("[TTS] 正在加载已持久化的插件配置...")
         self._load_plugin_config()
+        self._rebuild_compiled_templates()
         logger.debug("[TTS] 配置加载完成, engine={}, voice={}, volume={}",
                      self._config.engine, self._config.voice, self._config.volume)
 
@@ -67,10 +141,20 @@ class Plugin(CW2Plugin):
 
         # 初始化引擎 + 播放器
         self._init_speaker()
+        self._prefetch_templates()
+
+        # 后台预先探测引擎列表，打开设置页时无需等待
+        threading.Thread(target=_get_engine_list, name="cw2-tts-probe", daemon=True).start()
 
         # 连接通知信号
         logger.debug("[TTS] 正在连接 notification.pushed 信号...")
         self.api.notification.pushed.connect(self._on_notification_pushed)
+        schedule_changed = getattr(self.api.schedule, "changed", None)
+        if schedule_changed is not None:
+            try:
+                schedule_changed.connect(self._invalidate_runtime_cache)
+            except Exception as e:
+                logger.debug("[TTS] 连接 schedule.changed 信号失败 (可忽略): {}", e)
         logger.debug("[TTS] 信号连接完成")
 
         backend = self._speaker.engine_name if self._speaker else "none"
@@ -83,6 +167,17 @@ class Plugin(CW2Plugin):
             logger.debug("[TTS] 已断开 notification.pushed 信号")
         except Exception as e:
             logger.debug("[TTS] 断开信号时异常 (可忽略): {}", e)
+        schedule_changed = getattr(self.api.schedule, "changed", None)
+        if schedule_changed is not None:
+            try:
+                schedule_changed.disconnect(self._invalidate_runtime_cache)
+            except Exception:
+                pass
+
+        # 立即写入尚未保存的配置
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_config()
 
         if self._speaker is not None:
             logger.debug("[TTS] 正在关闭 Speaker...")
@@ -97,9 +192,7 @@ class Plugin(CW2Plugin):
     @Slot(result=list)
     def getAvailableEngines(self) -> list:
         """返回所有可用引擎列表: [{"name": str, "available": str}, ...]"""
-        engines = list_available_engines()
-        # 在列表前面加一个 "auto" 选项
-        return [{"name": "auto", "available": "true"}] + engines
+        return _get_engine_list()
 
     @Slot(result=str)
     def getCurrentEngine(self) -> str:
@@ -114,14 +207,17 @@ class Plugin(CW2Plugin):
             return
 
         self._config.engine = engine_name
-        self._save_config()
+        self._schedule_save()
 
         # 热切换引擎
         self._init_speaker()
+        self._prefetch_templates()
         self.engineChanged.emit()
 
         # 切换引擎后清空 voice 缓存
         self._voice_cache = []
+        with _cache_lock:
+            _voices_cache.clear()
         self.voiceListChanged.emit()
 
     @Slot(result=list)
@@ -131,31 +227,56 @@ class Plugin(CW2Plugin):
 
     @Slot()
     def refreshVoiceList(self) -> None:
-        """异步刷新当前引擎的语音列表。"""
+        """异步刷新当前引擎的语音列表（优先使用缓存）。"""
+        self._refresh_voice_list(force=False)
+
+    @Slot()
+    def forceRefreshVoiceList(self) -> None:
+        """丢弃缓存，重新枚举当前引擎的语音列表（设置页“刷新”按钮）。"""
+        self._refresh_voice_list(force=True)
+
+    def _refresh_voice_list(self, force: bool) -> None:
         if self._voices_loading:
             return
         self._voices_loading = True
 
         def _worker():
+            changed = True
             try:
                 engine_name = self._config.engine
                 if engine_name == "auto" and self._speaker:
                     engine_name = self._speaker.engine_name
                 if not engine_name or engine_name == "auto":
-                    self._voice_cache = []
+                    cached = []
                 else:
-                    voices = list_voices_for_engine(engine_name)
-                    self._voice_cache = [
-                        {"id": v[0], "name": v[1], "locale": v[2] if len(v) > 2 else ""}
-                        for v in voices
-                    ]
-                logger.debug("[TTS] 语音列表刷新完成, {} 条", len(self._voice_cache))
+                    # 引擎自身缓存枚举结果，命中时返回同一列表对象
+                    voices = list_voices_for_engine(engine_name, refresh=force)
+                    with _cache_lock:
+                        entry = _voices_cache.get(engine_name)
+                    if entry is not None and entry[0] is voices:
+                        cached = entry[1]
+                    else:
+                        cached = [
+                            {"id": v[0], "name": v[1], "locale": v[2] if len(v) > 2 else ""}
+                            for v in voices
+                        ]
+                        if cached:
+                            with _cache_lock:
+                                _voices_cache[engine_name] = (voices, cached)
+                # 与界面当前显示的列表一致时不通知 QML 重建
+                if cached == self._voice_cache:
+                    changed = False
+                    logger.debug("[TTS] 语音列表未变化, 跳过刷新")
+                else:
+                    self._voice_cache = cached
+                    logger.debug("[TTS] 语音列表刷新完成, {} 条", len(cached))
             except Exception as e:
                 logger.warning("[TTS] 语音列表刷新失败: {}", e)
                 self._voice_cache = []
             finally:
                 self._voices_loading = False
-                self.voiceListChanged.emit()
+                if changed:
+                    self.voiceListChanged.emit()
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -169,10 +290,11 @@ class Plugin(CW2Plugin):
         """设置语音并通知引擎。"""
         logger.info("[TTS] setVoice 调用: {}", voice_id)
         self._config.voice = voice_id
-        self._save_config()
+        self._schedule_save()
 
         if self._speaker and self._speaker.engine:
             self._speaker.engine.set_voice(voice_id)
+            self._prefetch_templates()
         self.configChanged.emit()
 
     @Slot(result=float)
@@ -186,7 +308,7 @@ class Plugin(CW2Plugin):
         volume = max(0.0, min(1.0, volume))
         logger.debug("[TTS] setVolume: {}", volume)
         self._config.volume = volume
-        self._save_config()
+        self._schedule_save()
 
         if self._speaker:
             self._speaker.volume = volume
@@ -207,7 +329,8 @@ class Plugin(CW2Plugin):
         """设置指定 activity 的朗读模板。"""
         logger.debug("[TTS] setTemplate: {}={!r}", key, template)
         self._config.templates[key] = template
-        self._save_config()
+        self._rebuild_compiled_templates()
+        self._schedule_save()
         self.configChanged.emit()
 
     @Slot(str, result=str)
@@ -218,9 +341,9 @@ class Plugin(CW2Plugin):
     @Slot(str)
     def resetTemplate(self, key: str) -> None:
         """重置指定 activity 的模板为默认值。"""
-        default = DEFAULT_TEMPLATES.get(key, "")
-        self._config.templates[key] = default
-        self._save_config()
+        self._config.templates.pop(key, None)
+        self._rebuild_compiled_templates()
+        self._schedule_save()
         self.configChanged.emit()
 
     @Slot(str)
@@ -255,25 +378,56 @@ class Plugin(CW2Plugin):
         else:
             logger.warning("[TTS] 未能创建任何 TTS 引擎, 语音播报将不可用")
 
+    def _rebuild_compiled_templates(self) -> None:
+        """按当前配置重新编译各 activity 的模板（空模板回退到默认）。"""
+        templates = self._config.effective_templates
+        self._compiled_templates = {
+            key: compile_template(templates.get(key) or default)
+            for key, default in DEFAULT_TEMPLATES.items()
+        }
+
+    def _prefetch_templates(self) -> None:
+        """用当前课程信息渲染各 activity 模板，并在后台预合成到缓存。
+
+        缓存 key 包含引擎与语音，因此切换引擎或语音后需要重新预合成。
+        """
+        if self._speaker is None:
+            return
+        runtime_context = self._build_runtime_context()
+        texts = []
+        for renderer in self._compiled_templates.values():
+            try:
+                text = renderer(runtime_context)
+            except Exception as e:
+                # 预合成只是优化，模板有误时跳过即可，朗读时会回退
+                logger.debug("[TTS] 预合成模板渲染失败, 跳过: {}", e)
+                continue
+            if text and text not in texts:
+                texts.append(text)
+        logger.debug("[TTS] 预合成模板文案: {}", texts)
+        self._speaker.prefetch(texts)
+
     def _load_plugin_config(self) -> None:
         """从宿主读取已持久化的插件配置。"""
         try:
             model = self.api.config.get_plugin_model(self.pid)
             logger.debug("[TTS] 从宿主获取到配置模型: {}", model)
             if model and hasattr(model, "engine"):
-                self._config.engine = str(getattr(model, "engine", "auto") or "auto")
-                self._config.voice = str(getattr(model, "voice", "") or "")
-                self._config.volume = float(getattr(model, "volume", 1.0) or 1.0)
+                for name, cast, default in _COERCERS:
+                    setattr(self._config, name, cast(getattr(model, name, default) or default))
                 saved_templates = getattr(model, "templates", None)
                 if isinstance(saved_templates, dict):
-                    for key, val in saved_templates.items():
-                        self._config.templates[key] = str(val)
+                    self._config.templates.update({k: str(v) for k, v in saved_templates.items()})
                 logger.debug("[TTS] 配置已恢复")
             else:
                 logger.debug("[TTS] 未找到已保存的配置模型, 使用默认值")
         except Exception as e:
             logger.warning("[TTS] 加载已持久化配置失败: {}", e)
 
+    def _schedule_save(self) -> None:
+        """延迟保存配置，短时间内的多次变更只写盘一次。"""
+        self._save_timer.start()
+
     def _save_config(self) -> None:
         """触发配置持久化。"""
         try:
@@ -285,10 +439,9 @@ class Plugin(CW2Plugin):
     def _register_settings_page(self) -> None:
         """注册 QML 设置页面。"""
         try:
-            settings_qml = os.path.join(os.path.dirname(__file__), "qml", "settings.qml")
-            logger.debug("[TTS] 正在注册设置页: {}", settings_qml)
+            logger.debug("[TTS] 正在注册设置页: {}", _SETTINGS_QML)
             self.api.ui.register_settings_page(
-                qml_path=settings_qml,
+                qml_path=_SETTINGS_QML,
                 title="TTS 服务",
                 icon="ic_fluent_speaker_2_20_regular",
             )
@@ -298,33 +451,63 @@ class Plugin(CW2Plugin):
 
     def _on_notification_pushed(self, payload: dict) -> None:
         """通知推送回调。"""
-        logger.debug("[TTS] 收到通知推送: provider_id={}, title={!r}, message={!r}",
-                      payload.get("provider_id"), payload.get("title"), payload.get("message"))
+        logger.opt(lazy=True).debug(
+            "[TTS] 收到通知推送: provider_id={}, title={}, message={}",
+            lambda: payload.get("provider_id"),
+            lambda: _brief(payload.get("title")),
+            lambda: _brief(payload.get("message")),
+        )
         if self._speaker is None:
             logger.warning("[TTS] Speaker 为 None, 跳过朗读")
             return
 
+        # 合并短时间内重复推送的同一条通知
+        push = (payload.get("provider_id"), payload.get("title"), payload.get("message"))
+        now = time.monotonic()
+        if push == self._last_push and now - self._last_push_ts < _PUSH_DEBOUNCE:
+            logger.debug("[TTS] 重复通知推送, 跳过")
+            return
+        self._last_push = push
+        self._last_push_ts = now
+
         # 从 RuntimeAPI 获取结构化课程信息，供模板使用
         runtime_context = self._build_runtime_context()
 
         text = build_announce_text(
             payload,
-            templates=self._config.templates,
+            templates=self._config.effective_templates,
             runtime_context=runtime_context,
+            compiled=self._compiled_templates,
         )
-        logger.debug("[TTS] 构建朗读文案: {!r}", text)
+        logger.opt(lazy=True).debug("[TTS] 构建朗读文案: {}", lambda: _brief(text))
         if text:
             self._speaker.speak(text)
         else:
             logger.debug("[TTS] 文案为空, 跳过朗读")
 
+    def _invalidate_runtime_cache(self, *args) -> None:
+        """课表变化时丢弃缓存的 runtime 课程信息。"""
+        self._rt_cache = None
+        self._subjects_index = None
+        self._subjects_index_src = None
+
     def _build_runtime_context(self) -> dict:
         """从 RuntimeAPI 提取当前/下一节课程的结构化信息。
 
+        同一波推送（_RUNTIME_CACHE_TTL 内）看到的课程状态相同，直接复用上次结果。
         返回字典包含:
           subject, teacher, location       — 当前科目
           next_subject, next_teacher, next_location — 下一节科目
         """
+        now = time.monotonic()
+        if self._rt_cache is not None and now - self._rt_cache[0] < _RUNTIME_CACHE_TTL:
+            return self._rt_cache[1]
+        ctx = self._read_runtime_context()
+        self._rt_cache = (now, ctx)
+        return ctx
+
+    def _read_runtime_context(self) -> dict:
+        """实际读取 RuntimeAPI 与课表，构建 runtime_context。"""
         ctx: dict = {
             "subject": "",
             "teacher": "",
@@ -354,26 +537,25 @@ class Plugin(CW2Plugin):
             if next_entries:
                 next_entry = next_entries[0]
                 next_sid = next_entry.get("subjectId")
-                logger.debug(
+                logger.opt(lazy=True).debug(
                     "[TTS] next_entry: subjectId={!r}, title={!r}, raw={}",
-                    next_sid,
-                    next_entry.get("title"),
-                    next_entry,
+                    lambda: next_sid,
+                    lambda: next_entry.get("title"),
+                    lambda: _brief(next_entry),
                 )
                 # 尝试从 schedule 中查找 subject 详情
                 if next_sid:
                     try:
                         schedule_data = self.api.schedule.get()
                         if schedule_data and hasattr(schedule_data, "subjects"):
-                            logger.debug("[TTS] schedule.subjects 数量: {}", len(schedule_data.subjects))
-                            for s in schedule_data.subjects:
+                            s = self._get_subjects_index(schedule_data).get(next_sid)
+                            if s is not None:
                                 sd = s.model_dump() if hasattr(s, "model_dump") else s
-                                if sd.get("id") == next_sid:
-                                    ctx["next_subject"] = sd.get("name", "") or ""
-                                    ctx["next_teacher"] = sd.get("teacher", "") or ""
-                                    ctx["next_location"] = sd.get("location", "") or ""
-                                    logger.debug("[TTS] 匹配到下一节 subject: {}", sd)
-                                    break
+                                ctx["next_subject"] = sd.get("name", "") or ""
+                                ctx["next_teacher"] = sd.get("teacher", "") or ""
+                                ctx["next_location"] = sd.get("location", "") or ""
+                                logger.opt(lazy=True).debug("[TTS] 匹配到下一节 subject: {}",
+                                                            lambda: _brief(sd))
                     except Exception as e:
                         logger.debug("[TTS] 获取下一节 subject 详情失败: {}", e)
                 else:
@@ -389,5 +571,21 @@ class Plugin(CW2Plugin):
         except Exception as e:
             logger.warning("[TTS] 获取 runtime 课程信息失败: {}", e)
 
-        logger.debug("[TTS] runtime_context: {}", ctx)
+        logger.opt(lazy=True).debug("[TTS] runtime_context: {}", lambda: _brief(ctx))
         return ctx
+
+    def _get_subjects_index(self, schedule_data) -> dict:
+        """返回 schedule.subjects 的 {id: subject} 索引。
+
+        以 schedule 对象本身作为失效依据（持有引用，避免 id() 复用），
+        subject 保持原对象，命中后才调用 model_dump()。
+        """
+        if self._subjects_index is None or self._subjects_index_src is not schedule_data:
+            index = {}
+            for s in schedule_data.subjects:
+                sid = s.get("id") if isinstance(s, dict) else getattr(s, "id", None)
+                index[sid] = s
+            self._subjects_index = index
+            self._subjects_index_src = schedule_data
+            logger.debug("[TTS] schedule.subjects 索引已重建, 数量: {}", len(index))
+        return self._subjects_index
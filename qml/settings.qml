@@ -51,6 +51,20 @@ PluginPage {
         return locales
     }
 
+    // 从后端读取语音列表，并推断选中的语言
+    function loadVoiceList() {
+        voiceModel = backend.getVoiceList()
+        if (currentVoice) {
+            for (let i = 0; i < voiceModel.length; i++) {
+                if (voiceModel[i].id === currentVoice) {
+                    selectedLocale = voiceModel[i].locale || ""
+                    return
+                }
+            }
+        }
+        selectedLocale = ""
+    }
+
     // 根据 selectedLocale 过滤语音
     function getVoicesForLocale(locale) {
         let filtered = []
@@ -70,7 +84,8 @@ PluginPage {
         currentVoice = backend.getCurrentVoice()
         currentVolume = backend.getVolume()
         activeEngine = backend.getActiveEngineName()
-        // 触发语音列表加载
+        // 先显示已有的语音列表，列表有变化时后端再发出 voiceListChanged
+        loadVoiceList()
         backend.refreshVoiceList()
         ready = true
     }
@@ -82,17 +97,7 @@ PluginPage {
             activeEngine = backend.getActiveEngineName()
         }
         function onVoiceListChanged() {
-            voiceModel = backend.getVoiceList()
-            // 自动推断选中的语言
-            if (currentVoice) {
-                for (let i = 0; i < voiceModel.length; i++) {
-                    if (voiceModel[i].id === currentVoice) {
-                        selectedLocale = voiceModel[i].locale || ""
-                        return
-                    }
-                }
-            }
-            selectedLocale = ""
+            loadVoiceList()
         }
         function onConfigChanged() {
             currentVoice = backend.getCurrentVoice()
@@ -238,7 +243,7 @@ PluginPage {
                     icon.name: "ic_fluent_arrow_sync_20_regular"
                     flat: true
                     ToolTip { text: qsTr("刷新语音列表"); visible: parent.hovered }
-                    onClicked: backend.refreshVoiceList()
+                    onClicked: backend.forceRefreshVoiceList()
                 }
             }
         }
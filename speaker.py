@@ -2,18 +2,245 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import json
+import os
+import queue
+import re
 import tempfile
 import threading
-import uuid
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, List, Optional, Set, Tuple, Union
 
 from loguru import logger
-from PySide6.QtCore import QUrl, QEventLoop, QTimer
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QUrl, QEventLoop, Signal, Slot
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 from engines.base import TTSEngine
 
+_TMP_DIR = Path(tempfile.gettempdir())
+
+# 合成结果缓存目录与容量上限
+_CACHE_DIR = _TMP_DIR / "cw2_tts_cache"
+_CACHE_MAX_BYTES = 20 * 1024 * 1024
+_CACHE_INDEX = "index.json"
+
+# 临时文件名只需进程内唯一：进程号 + 自增序号
+_PID = os.getpid()
+_tmp_counter = itertools.count()
+
+# 分句：在句末标点（含连续标点）或后接空白的 "." 处切分，标点保留在句尾
+_SENTENCE_RE = re.compile(r".+?(?:[。！？!?；;\n]+|\.(?=\s|$)|$)", re.S)
+# 首句过长时再按逗号切一次，让第一段音频尽快开始播放
+_CLAUSE_RE = re.compile(r".+?(?:[，,、]+|$)", re.S)
+_FIRST_CHUNK_MAX = 16
+
+# 待朗读文案队列容量，满时丢弃最早的一条
+_SPEAK_QUEUE_SIZE = 8
+# 一条文案入队播放后，最多等待多久再开始合成下一条（秒）
+_PLAYBACK_WAIT = 2.0
+# 同一文案在该时间内重复提交时直接忽略（秒）
+_REPEAT_WINDOW = 3.0
+
+# 待播放音频：(内存中的音频数据, 扩展名)
+AudioData = Tuple[bytes, str]
+
+
+def _split_sentences(text: str) -> List[str]:
+    """将朗读文本切分为可流水线合成的句子片段。"""
+    chunks = [c.strip() for c in _SENTENCE_RE.findall(text)]
+    chunks = [c for c in chunks if c]
+    if chunks and len(chunks[0]) > _FIRST_CHUNK_MAX:
+        clauses = [c for c in _CLAUSE_RE.findall(chunks[0]) if c.strip()]
+        if len(clauses) > 1:
+            chunks[0:1] = [clauses[0].strip(), "".join(clauses[1:]).strip()]
+    return chunks or [text]
+
+
+class _PlaybackBridge(QObject):
+    """将后台线程的“音频就绪”通知转发到主线程。"""
+
+    audioReady = Signal()
+
+    def __init__(self, callback) -> None:
+        super().__init__()
+        self._callback = callback
+        # 接收者位于主线程，跨线程 emit 时自动排队执行
+        self.audioReady.connect(self._dispatch)
+
+    @Slot()
+    def _dispatch(self) -> None:
+        self._callback()
+
+
+class SynthCache:
+    """合成音频的磁盘 LRU 缓存。
+
+    以 (引擎, 语音, 文本) 的 SHA-256 为 key 保存合成产物，
+    相同文案再次朗读时直接复用文件，跳过合成。
+    总大小超过 max_bytes 时按最近最少使用淘汰。
+    """
+
+    def __init__(self, cache_dir: Path = _CACHE_DIR, max_bytes: int = _CACHE_MAX_BYTES) -> None:
+        self._dir = cache_dir
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._total = 0
+        # 淘汰时删除失败（如 Windows 上仍被播放器占用）的文件，待播放结束后重试
+        self._orphans: Set[Path] = set()
+        self._lock = threading.Lock()
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("[TTS.Cache] 创建缓存目录失败: {}", e)
+        self._load_index()
+
+    @staticmethod
+    def make_key(engine_name: str, voice_id: str, text: str) -> str:
+        return hashlib.sha256(f"{engine_name}\0{voice_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Path]:
+        """命中时返回缓存文件路径，并将其标记为最近使用。"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            path, size = entry
+            if not path.exists():
+                del self._entries[key]
+                self._total -= size
+                return None
+            self._entries.move_to_end(key)
+            return path
+
+    def put(self, key: str, data: bytes, suffix: str) -> Optional[Path]:
+        """将合成好的音频写入缓存，返回缓存内路径；失败时返回 None。"""
+        dest = self._dir / f"{key}{suffix}"
+        part = dest.with_name(f"{dest.name}.{_PID}_{next(_tmp_counter)}.part")
+        with self._lock:
+            # 同名文件即将重新写入，不能再被当作待删除的淘汰文件
+            self._orphans.discard(dest)
+        try:
+            part.write_bytes(data)
+            os.replace(part, dest)
+        except OSError as e:
+            logger.warning("[TTS.Cache] 写入缓存失败: {}", e)
+            try:
+                part.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        size = len(data)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= old[1]
+            self._entries[key] = (dest, size)
+            self._total += size
+            self._evict()
+        return dest
+
+    def save_index(self) -> None:
+        """将缓存索引（按 LRU 顺序）持久化到缓存目录。"""
+        with self._lock:
+            entries = [[key, path.name, size] for key, (path, size) in self._entries.items()]
+        try:
+            (self._dir / _CACHE_INDEX).write_text(json.dumps(entries), encoding="utf-8")
+            logger.debug("[TTS.Cache] 索引已保存, {} 条, {} bytes", len(entries), self._total)
+        except OSError as e:
+            logger.warning("[TTS.Cache] 保存索引失败: {}", e)
+
+    def _load_index(self) -> None:
+        """加载索引，并收编索引之外的缓存文件（如上次未正常退出时写入的）。"""
+        try:
+            entries = json.loads((self._dir / _CACHE_INDEX).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = []
+        if not isinstance(entries, list):
+            entries = []
+        for entry in entries:
+            # 跳过损坏或被手动修改的条目
+            try:
+                key, name, size = entry
+                path = self._dir / name
+                size = int(size)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(key, str) or path.parent != self._dir or key in self._entries:
+                continue
+            if path.is_file():
+                self._entries[key] = (path, size)
+                self._total += size
+        self._adopt_unindexed()
+        self._evict()
+        logger.debug("[TTS.Cache] 已加载索引, {} 条, {} bytes", len(self._entries), self._total)
+
+    def _adopt_unindexed(self) -> None:
+        """扫描缓存目录：索引中没有的缓存文件按修改时间补入索引，残留的 .part 文件直接删除。"""
+        indexed = {path.name for path, _ in self._entries.values()}
+        found = []
+        try:
+            with os.scandir(self._dir) as it:
+                for item in it:
+                    if item.name == _CACHE_INDEX or item.name in indexed or not item.is_file():
+                        continue
+                    if item.name.endswith(".part"):
+                        try:
+                            os.unlink(item.path)
+                        except OSError:
+                            pass
+                        continue
+                    key = item.name.partition(".")[0]
+                    if len(key) != 64 or key in self._entries:
+                        continue
+                    st = item.stat()
+                    found.append((st.st_mtime, key, Path(item.path), st.st_size))
+        except OSError as e:
+            logger.debug("[TTS.Cache] 扫描缓存目录失败: {}", e)
+            return
+        # 未入索引的文件写于上次保存索引之后，视为最近使用
+        for _, key, path, size in sorted(found):
+            self._entries[key] = (path, size)
+            self._total += size
+        if found:
+            logger.debug("[TTS.Cache] 收编未入索引的缓存文件 {} 个", len(found))
+
+    def _evict(self) -> None:
+        """淘汰最久未使用的条目，直到总大小不超过上限（至少保留一条）。"""
+        while self._total > self._max_bytes and len(self._entries) > 1:
+            _, (path, size) = self._entries.popitem(last=False)
+            self._total -= size
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug("[TTS.Cache] 淘汰缓存文件失败, 稍后重试: {}", e)
+                self._orphans.add(path)
+
+    def purge_orphans(self) -> None:
+        """重试删除淘汰时未能删除的文件，应在播放器释放文件句柄后调用。
+
+        不等待：仍被占用的文件留到下一次释放音频源时再试。
+        """
+        with self._lock:
+            if not self._orphans:
+                return
+            # 已被重新写入缓存的文件不再删除
+            live = {path for path, _ in self._entries.values()}
+            for path in list(self._orphans):
+                if path in live:
+                    self._orphans.discard(path)
+                    continue
+                try:
+                    path.unlink(missing_ok=True)
+                except PermissionError:
+                    continue
+                except OSError as e:
+                    logger.debug("[TTS.Cache] 删除淘汰文件失败: {}", e)
+                self._orphans.discard(path)
+
 
 class Speaker:
     """管理 TTS 合成与 QMediaPlayer 音频播放。
@@ -27,12 +254,27 @@ class Speaker:
         self._volume = max(0.0, min(1.0, volume))
         self._lock = threading.Lock()
         self._stopped = False
+        self._cache = SynthCache()
+        # 最近一次提交的文案及时间，用于丢弃重复朗读
+        self._last_text = ""
+        self._last_text_ts = 0.0
+
+        # 预热引擎会话，之后所有合成复用同一会话
+        try:
+            self._engine.prepare()
+        except Exception as e:
+            logger.warning("[TTS.Speaker] 引擎预热失败: {}", e)
 
         # QMediaPlayer 实例
         self._player: Optional[QMediaPlayer] = None
         self._audio_output: Optional[QAudioOutput] = None
         self._init_player()
 
+        # 单一后台线程按顺序消费朗读请求，串行访问引擎
+        self._speak_queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=_SPEAK_QUEUE_SIZE)
+        self._worker = threading.Thread(target=self._run_loop, name="cw2-tts-speaker", daemon=True)
+        self._worker.start()
+
         logger.debug("[TTS.Speaker] 初始化完成, engine={}, volume={}", engine.name, self._volume)
 
     def _init_player(self) -> None:
@@ -41,29 +283,40 @@ class Speaker:
         self._audio_output = QAudioOutput()
         self._audio_output.setVolume(self._volume)
         self._player.setAudioOutput(self._audio_output)
-        # 播放完毕后清理临时文件
-        self._player.playbackStateChanged.connect(self._on_playback_state_changed)
-        self._pending_cleanup: Optional[Path] = None
-
-    def _on_playback_state_changed(self, state: QMediaPlayer.PlaybackState) -> None:
-        """播放结束后清理临时文件。"""
-        if state == QMediaPlayer.PlaybackState.StoppedState:
-            if self._pending_cleanup is not None:
-                tmp = self._pending_cleanup
-                self._pending_cleanup = None
-                try:
-                    # 延迟一点删除，确保文件句柄已释放
-                    QTimer.singleShot(1500, lambda: self._safe_unlink(tmp))
-                except Exception:
-                    pass
-
-    def _safe_unlink(self, path: Path) -> None:
+        # 依赖原生的 EndOfMedia 通知衔接下一段，无需 stop() 后重新加载
+        self._player.mediaStatusChanged.connect(self._on_media_status_changed)
+        self._playing = False
+        # 正在播放的内存音频，需保持存活直到播放结束
+        self._current_buffer: Optional[QBuffer] = None
+
+        # 合成线程 → 主线程的待播放队列，有界以提供背压
+        self._audio_queue: "queue.Queue[AudioData]" = queue.Queue(maxsize=2)
+        self._bridge = _PlaybackBridge(self._play_next)
+        # 播放队列已空且播放器停止时置位
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def _on_media_status_changed(self, status: QMediaPlayer.MediaStatus) -> None:
+        """一段播放结束（或无法播放）后直接切换到下一段，队列为空时释放内存缓冲。"""
+        if status not in (QMediaPlayer.MediaStatus.EndOfMedia, QMediaPlayer.MediaStatus.InvalidMedia):
+            return
+        self._playing = False
+        if not self._stopped and self._play_next():
+            return
+        self._release_source()
+        self._cache.purge_orphans()
+        self._idle.set()
+
+    def _release_source(self) -> None:
+        """让播放器放开当前音频（文件句柄或内存缓冲）。"""
+        buf = self._current_buffer
+        self._current_buffer = None
         try:
-            self._player.setSource(QUrl()) 
-            path.unlink(missing_ok=True)
-            logger.debug("[TTS.Speaker] 临时文件已清理: {}", path)
+            self._player.setSource(QUrl())
+            if buf is not None:
+                buf.close()
         except Exception as e:
-            logger.warning("[TTS.Speaker] 清理临时文件失败: {}", e)
+            logger.warning("[TTS.Speaker] 释放音频源失败: {}", e)
 
     @property
     def engine_name(self) -> str:
@@ -80,6 +333,7 @@ class Speaker:
     @volume.setter
     def volume(self, value: float) -> None:
         self._volume = max(0.0, min(1.0, value))
+        # 仅由主线程（QML Slot）调用；后台线程不应直接改音量，_play 每次播放前也会重新应用
         if self._audio_output is not None:
             self._audio_output.setVolume(self._volume)
         logger.debug("[TTS.Speaker] 音量已设置: {}", self._volume)
@@ -87,30 +341,74 @@ class Speaker:
     # ---- public API --------------------------------------------------------
 
     def speak(self, text: str) -> None:
-        """在后台线程中合成，然后回主线程播放。"""
+        """将文案加入朗读队列，由后台线程合成后回主线程播放。"""
         if self._stopped:
             logger.debug("[TTS.Speaker] speak() 被调用但已停止, 跳过")
             return
-        logger.debug("[TTS.Speaker] 启动后台线程朗读: {!r}", text[:80])
-        threading.Thread(target=self._speak_worker, args=(text,), daemon=True).start()
+        now = time.monotonic()
+        if text == self._last_text and now - self._last_text_ts < _REPEAT_WINDOW:
+            logger.debug("[TTS.Speaker] 与上一条文案相同, 跳过")
+            return
+        self._last_text = text
+        self._last_text_ts = now
+        logger.opt(lazy=True).debug("[TTS.Speaker] 加入朗读队列: {!r}", lambda: text[:80])
+        self._put_request(text)
+
+    def prefetch(self, texts: Iterable[str], interval: float = 0.1) -> None:
+        """在后台线程中依次预合成文案并写入缓存，不播放。
+
+        :param texts: 待预合成的文案
+        :param interval: 相邻两条之间的间隔秒数，避免短时间内大量请求在线引擎
+        """
+        texts = list(texts)
+        if self._stopped or not texts:
+            return
+
+        def _worker() -> None:
+            for text in texts:
+                # 与 speak 使用相同的分句，保证缓存 key 一致
+                for chunk in _split_sentences(text):
+                    if self._stopped:
+                        return
+                    try:
+                        self._synthesize_cached(chunk)
+                    except Exception as e:
+                        logger.debug("[TTS.Speaker] 预合成失败: {!r}, {}", chunk, e)
+                    time.sleep(interval)
+            logger.debug("[TTS.Speaker] 预合成完成, {} 条", len(texts))
+
+        threading.Thread(target=_worker, daemon=True).start()
 
     def swap_engine(self, new_engine: TTSEngine) -> None:
         """热切换 TTS 引擎。"""
         logger.debug("[TTS.Speaker] 切换引擎: {} -> {}", self._engine.name, new_engine.name)
+        try:
+            new_engine.prepare()
+        except Exception as e:
+            logger.warning("[TTS.Speaker] 引擎预热失败: {}", e)
         old = self._engine
         self._engine = new_engine
         try:
             old.stop()
-            old.cleanup()
         except Exception as e:
-            logger.debug("[TTS.Speaker] 旧引擎清理异常: {}", e)
+            logger.debug("[TTS.Speaker] 旧引擎停止异常: {}", e)
+        self._release_engine(old)
 
     def shutdown(self) -> None:
         """停止播放并释放所有资源。"""
         logger.debug("[TTS.Speaker] shutdown 开始")
         self._stopped = True
+        # 唤醒可能正在等待播放结束的朗读线程（EndOfMedia 回调需要主线程，此处不会再到达）
+        self._idle.set()
         self._engine.stop()
 
+        # 通知后台线程退出
+        self._put_request(None)
+        # 合成中的线程不必等待，引擎清理会推迟到合成结束
+        self._worker.join(timeout=0.2)
+        if self._worker.is_alive():
+            logger.debug("[TTS.Speaker] 朗读线程仍在合成, 引擎将在合成结束后释放")
+
         if self._player is not None:
             try:
                 self._player.stop()
@@ -118,57 +416,198 @@ class Speaker:
             except Exception as e:
                 logger.warning("[TTS.Speaker] 停止 QMediaPlayer 时异常: {}", e)
 
-        self._engine.cleanup()
+        # 丢弃尚未播放的片段
+        while True:
+            try:
+                self._audio_queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._player is not None:
+            self._release_source()
+        self._cache.purge_orphans()
+
+        self._release_engine(self._engine, self._cache.save_index)
         logger.debug("[TTS.Speaker] shutdown 完成")
 
     # ---- internal ----------------------------------------------------------
 
-    def _speak_worker(self, text: str) -> None:
-        """合成音频文件（后台线程），然后调用主线程播放。"""
-        tmp_path: Optional[Path] = None
-        try:
-            suffix = ".mp3" if self._engine.name == "edge" else ".wav"
-            tmp_path = Path(tempfile.gettempdir()) / f"cw2_tts_{self._engine.name}_{uuid.uuid4().hex}{suffix}"
-            logger.debug("[TTS.Speaker] 临时文件路径: {}", tmp_path)
+    def _release_engine(self, engine: TTSEngine, then: Optional[Callable[[], None]] = None) -> None:
+        """在没有合成进行时清理引擎，随后执行 then。
 
-            # 1. 合成（在后台线程）
-            logger.debug("[TTS.Speaker] 开始合成, 文本长度={}", len(text))
-            self._engine.synthesize(text, tmp_path)
-            logger.debug("[TTS.Speaker] 合成完成, 文件大小={} bytes",
-                         tmp_path.stat().st_size if tmp_path.exists() else 0)
+        合成锁被占用时（朗读或预合成线程仍在合成）转到后台线程等待，避免阻塞主线程，
+        也避免在合成中途释放引擎。
+        """
+        def _cleanup() -> None:
+            try:
+                engine.cleanup()
+            except Exception as e:
+                logger.debug("[TTS.Speaker] 引擎清理异常: {}", e)
+            if then is not None:
+                then()
 
-            if self._stopped:
-                logger.debug("[TTS.Speaker] 合成后发现已停止, 跳过播放")
+        if self._lock.acquire(blocking=False):
+            try:
+                _cleanup()
+            finally:
+                self._lock.release()
+            return
+
+        def _deferred() -> None:
+            with self._lock:
+                _cleanup()
+
+        threading.Thread(target=_deferred, name="cw2-tts-cleanup", daemon=True).start()
+
+    def _put_request(self, text: Optional[str]) -> None:
+        """入队朗读请求（None 为退出信号），队列满时丢弃最早的一条。"""
+        while True:
+            try:
+                self._speak_queue.put_nowait(text)
                 return
+            except queue.Full:
+                try:
+                    dropped = self._speak_queue.get_nowait()
+                except queue.Empty:
+                    continue
+                logger.warning("[TTS.Speaker] 朗读队列已满, 丢弃: {!r}", (dropped or "")[:80])
+
+    def _run_loop(self) -> None:
+        """后台线程：依次取出朗读请求并处理，收到 None 时退出。"""
+        while True:
+            text = self._speak_queue.get()
+            if text is None or self._stopped:
+                break
+            self._speak_worker(text)
+            # 上一条播完（或超时）后再处理下一条，避免读报重叠
+            self._idle.wait(timeout=_PLAYBACK_WAIT)
+        logger.debug("[TTS.Speaker] 朗读线程已退出")
 
-            # 2. 在主线程播放（QMediaPlayer 必须在创建它的线程操作）
-            logger.debug("[TTS.Speaker] 请求主线程播放音频...")
-            self._play(tmp_path)
-            logger.debug("[TTS.Speaker] 播放已启动")
+    def _speak_worker(self, text: str) -> None:
+        """逐句合成（后台线程）并交给主线程排队播放。
 
+        第 k 句播放期间即开始合成第 k+1 句，首段音频只需等待第一句合成完成。
+        """
+        try:
+            chunks = _split_sentences(text)
+            logger.debug("[TTS.Speaker] 分句完成, {} 段", len(chunks))
+            for chunk in chunks:
+                if self._stopped:
+                    logger.debug("[TTS.Speaker] 已停止, 跳过剩余片段")
+                    return
+                source = self._load_for_playback(chunk)
+                if source is None or not self._enqueue_audio(source):
+                    return
         except Exception as e:
             logger.error("[TTS.Speaker] TTS 朗读失败: {}", e)
             logger.exception(e)
-            # 合成失败时直接清理
-            if tmp_path is not None:
-                self._safe_unlink(tmp_path)
 
-    def _play(self, audio_path: Path) -> None:
-        """通过 QMediaPlayer 播放音频文件。
+    def _load_for_playback(self, text: str) -> Optional[AudioData]:
+        """合成或取缓存，并将缓存文件读入内存。
 
-        临时文件的清理由 playbackStateChanged 信号回调处理。
+        排队中的片段不持有缓存文件，预合成写入触发淘汰时不会删掉尚未播放的音频。
+        """
+        source = self._synthesize_cached(text)
+        if isinstance(source, Path):
+            try:
+                return source.read_bytes(), source.suffix
+            except OSError:
+                # 查到后、读取前被淘汰（或无法读取），跳过缓存查找直接重新合成
+                logger.debug("[TTS.Speaker] 读取缓存文件失败, 重新合成: {}", source)
+                return self._synthesize_cached(text, lookup=False)  # type: ignore[return-value]
+        return source
+
+    def _enqueue_audio(self, source: AudioData) -> bool:
+        """将片段放入待播放队列并通知主线程；队列满时等待，停止时返回 False。"""
+        while True:
+            if self._stopped:
+                return False
+            try:
+                self._audio_queue.put(source, timeout=0.5)
+                break
+            except queue.Full:
+                continue
+        self._idle.clear()
+        # 在主线程播放（QMediaPlayer 必须在创建它的线程操作）
+        self._bridge.audioReady.emit()
+        return True
+
+    def _synthesize_cached(self, text: str, lookup: bool = True) -> Optional[Union[Path, AudioData]]:
+        """合成文本并写入缓存，已缓存时直接返回缓存文件。
+
+        未命中（或 lookup=False 跳过查找）时返回内存中的音频数据；已停止时返回 None。
         """
+        if self._stopped:
+            return None
+        engine = self._engine
+        key = SynthCache.make_key(engine.name, engine.get_current_voice(), text)
+        cached = self._cache.get(key) if lookup else None
+        if cached is not None:
+            logger.debug("[TTS.Speaker] 命中合成缓存: {}", cached)
+            return cached
+
+        logger.debug("[TTS.Speaker] 开始合成, 文本长度={}", len(text))
+        # 预合成线程与朗读线程共用同一引擎，串行访问
+        with self._lock:
+            # 等锁期间可能已 shutdown，引擎随时会被清理
+            if self._stopped:
+                return None
+            try:
+                data = self._synthesize_checked(engine, text)
+            except Exception as e:
+                if self._stopped:
+                    return None
+                # 会话可能已失效（如连接中断），重建后重试一次
+                logger.warning("[TTS.Speaker] 合成失败, 重建引擎会话后重试: {}", e)
+                engine.prepare(reconnect=True)
+                data = self._synthesize_checked(engine, text)
+        # 合成期间 shutdown 会中断引擎，产物可能不完整，不能写入缓存
+        if self._stopped:
+            return None
+        logger.debug("[TTS.Speaker] 合成完成, 音频大小={} bytes", len(data))
+
+        suffix = engine.audio_suffix
+        self._cache.put(key, data, suffix)
+        return data, suffix
+
+    @staticmethod
+    def _synthesize_checked(engine: TTSEngine, text: str) -> bytes:
+        """合成音频，结果为空时视为失败，避免把无声结果写入缓存。"""
+        data = engine.synthesize_bytes(text)
+        if not data:
+            raise RuntimeError("引擎未输出音频数据")
+        return data
+
+    def _play_next(self) -> bool:
+        """（主线程）播放器空闲时从队列取出下一段开始播放，返回是否开始了播放。"""
+        if self._player is None or self._stopped:
+            return False
+        if self._playing:
+            return False
+        try:
+            source = self._audio_queue.get_nowait()
+        except queue.Empty:
+            return False
+        self._play(source)
+        return True
+
+    def _play(self, source: AudioData) -> None:
+        """通过 QMediaPlayer 播放内存音频，必须在主线程调用。"""
         if self._player is None:
             logger.warning("[TTS.Speaker] QMediaPlayer 未初始化, 跳过播放")
             return
 
-        # 先停止上一次播放
-        if self._player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self._player.stop()
-
-        self._pending_cleanup = audio_path
         self._audio_output.setVolume(self._volume)
 
-        logger.debug("[TTS.Speaker] 加载音频: {}", audio_path)
-        self._player.setSource(QUrl.fromLocalFile(str(audio_path)))
+        old_buffer = self._current_buffer
+        data, suffix = source
+        logger.debug("[TTS.Speaker] 加载内存音频: {} bytes", len(data))
+        buf = QBuffer()
+        buf.setData(QByteArray(data))
+        buf.open(QIODevice.OpenModeFlag.ReadOnly)
+        self._current_buffer = buf
+        # URL 仅作为格式提示
+        self._player.setSourceDevice(buf, QUrl(f"memory://tts{suffix}"))
+        if old_buffer is not None:
+            old_buffer.close()
+        self._playing = True
         self._player.play()